@@ -2,7 +2,11 @@
 Main application module for the TelegramMe API.
 """
 
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -12,14 +16,39 @@ from app.middleware.node import NodeMiddleware
 from app.middleware.process_time import ProcessTimeMiddleware
 from app.middleware.cache_header import ProxyCacheHeaderMiddleware
 
+from app.telegram.telegram import Telegram
+
 from app.utils.config import settings
 
+
+@asynccontextmanager
+async def lifespan(application: FastAPI) -> AsyncIterator[None]:
+    """
+    Application lifespan handler.
+    Warms up the shared upstream HTTP session and the OpenAPI schema on startup
+    and closes the session on shutdown.
+    """
+    if DOCS_ENABLED:
+        # Build the schema now instead of on the first documentation request
+        application.openapi()
+
+    await Telegram.warmup()
+    yield
+    await Telegram.close()
+
+
+# With docs disabled no schema or documentation routes are registered at all
+DOCS_ENABLED = not bool(settings.DISABLE_DOCS)
+
 app = FastAPI(
     title="TelegramMe API",
     description="API implementation of Telegram channel viewer in python",
     version=settings.VERSION,
-    docs_url="/",
-    openapi_url=None if bool(settings.DISABLE_DOCS) else "/openapi.json"
+    docs_url="/" if DOCS_ENABLED else None,
+    redoc_url="/redoc" if DOCS_ENABLED else None,
+    openapi_url="/openapi.json" if DOCS_ENABLED else None,
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 app.mount("/static", StaticFiles(directory="static"), name="static")
 app.add_middleware(
@@ -1,14 +1,14 @@
 """
 Middleware for adding cache control header
 """
-from typing import Callable
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+_CF_RAY: bytes = b"cf-ray"
+_CACHE_CONTROL_HEADER: tuple[bytes, bytes] = (
+    b"cache-control", b"public, max-age=10, stale-while-revalidate=10")
 
 
-class ProxyCacheHeaderMiddleware(BaseHTTPMiddleware):  # pylint: disable=R0903
+class ProxyCacheHeaderMiddleware:  # pylint: disable=R0903
     """
     Middleware to add caching headers for proxy servers. (Only for Cloudflare)
 
@@ -24,24 +24,27 @@ class ProxyCacheHeaderMiddleware(BaseHTTPMiddleware):  # pylint: disable=R0903
     """
 
     def __init__(self, app: ASGIApp) -> None:
-        super().__init__(app)
+        self.app = app
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Processes the incoming request and adds cache headers to the response.
 
         Args:
-            request (Request): The incoming request object.
-            call_next (Callable): The next middleware or route handler.
-
-        Returns:
-            Response: The response object with added caching headers.
+            scope (Scope): The ASGI connection scope.
+            receive (Receive): The ASGI receive channel.
+            send (Send): The ASGI send channel.
         """
-        # Call the next middleware or route handler
-        response = await call_next(request)
-
-        # Add Cache-Control headers to the response
-        if request.headers.get("CF-RAY"):
-            response.headers["Cache-Control"] = "public, max-age=10, stale-while-revalidate=10"
-
-        return response
+        # ASGI servers pass header names lowercased, so raw bytes can be compared directly
+        if scope["type"] != "http" or not any(
+                key == _CF_RAY and value for key, value in scope["headers"]):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Add Cache-Control headers to the response
+                message.setdefault("headers", []).append(_CACHE_CONTROL_HEADER)
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -2,37 +2,39 @@
 Middleware for add to response headers execution node identifier
 """
 import platform
-from typing import Callable
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+# The node name does not change during the process lifetime
+_NODE_HEADER: tuple[bytes, bytes] = (b"x-app-node", platform.node().encode("latin-1"))
 
-class NodeMiddleware(BaseHTTPMiddleware):  # pylint: disable=R0903
+
+class NodeMiddleware:  # pylint: disable=R0903
     """
     Middleware that adds a header to the response
     with the identifier of the server (node) that processed the request.
     """
 
     def __init__(self, app: ASGIApp) -> None:
-        super().__init__(app)
+        self.app = app
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Processes the incoming request and adds a custom header to the response.
 
         Args:
-            request (Request): The incoming request object.
-            call_next (Callable): The next middleware or route handler.
-
-        Returns:
-            Response: The response object with the added header.
+            scope (Scope): The ASGI connection scope.
+            receive (Receive): The ASGI receive channel.
+            send (Send): The ASGI send channel.
         """
-        # Call the next middleware or route handler
-        response = await call_next(request)
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        # Add the server's identifier (node name) to the response headers
-        response.headers["X-App-Node"] = platform.node()
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Add the server's identifier (node name) to the response headers
+                message.setdefault("headers", []).append(_NODE_HEADER)
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_wrapper)
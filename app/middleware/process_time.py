@@ -2,40 +2,40 @@
 Middleware for add to response headers time execution this request
 """
 import time
-from typing import Callable
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 
-class ProcessTimeMiddleware(BaseHTTPMiddleware):  # pylint: disable=R0903
+class ProcessTimeMiddleware:  # pylint: disable=R0903
     """
     Middleware to measure the processing time of requests and add it to the response headers.
     """
 
     def __init__(self, app: ASGIApp) -> None:
-        super().__init__(app)
+        self.app = app
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Measures the time taken to process the request and adds it to the response headers.
 
         Args:
-            request (Request): The incoming request object.
-            call_next (Callable): The next middleware or route handler.
-
-        Returns:
-            Response: The response object with the added processing time header.
+            scope (Scope): The ASGI connection scope.
+            receive (Receive): The ASGI receive channel.
+            send (Send): The ASGI send channel.
         """
-        # Record the start time before processing the request
-        start_time = time.time()
-
-        # Process the request by calling the next middleware or route handler
-        response = await call_next(request)
-
-        # Calculate the processing time in milliseconds
-        process_time = time.time() - start_time
-        response.headers["X-Process-Time"] = f"{int(process_time * 1000)} ms"
-
-        return response
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Record the start time before processing the request (monotonic clock)
+        start_time = time.perf_counter_ns()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Calculate the processing time in milliseconds
+                process_time = (time.perf_counter_ns() - start_time) // 1_000_000
+                message.setdefault("headers", []).append(
+                    (b"x-process-time", b"%d ms" % process_time))
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -9,9 +9,10 @@ from fastapi import Path, Query, HTTPException, APIRouter
 from app.models.error import HTTPError
 
 from app.telegram.models.body import ChannelBody
-from app.telegram.telegram import Telegram
+from app.telegram.telegram import get_telegram
 
 router = APIRouter()
+telegram = get_telegram()
 
 @router.get(
     "/body/{channel}",
@@ -28,7 +29,7 @@ async def body(
             None, description="History position")
 ) -> dict | None:
     """Request handler"""
-    result = await Telegram().body(channel, position)
+    result = await telegram.body(channel, position)
     if not result:
         raise HTTPException(status_code=404, detail="Channel or post not found")
 
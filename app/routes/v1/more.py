@@ -9,9 +9,10 @@ from pydantic import PositiveInt
 
 from app.models.error import HTTPError
 from app.telegram.models.more import More
-from app.telegram.telegram import Telegram
+from app.telegram.telegram import get_telegram
 
 router = APIRouter()
+telegram = get_telegram()
 
 @router.get(
     "/more/{channel}/{direction}/{position}",
@@ -28,7 +29,7 @@ async def more(
         position: PositiveInt = Path(description="History position")
 ) -> dict | None:
     """Request handler"""
-    result = await Telegram().more(channel, position, direction)
+    result = await telegram.more(channel, position, direction)
     if not result or not result.get("posts"):
         raise HTTPException(status_code=404, detail="Channel or post not found")
 
@@ -2,14 +2,16 @@
 Route handler for /post/{channel}/{identifier}
 """
 
-from fastapi import Path, HTTPException, APIRouter
+from fastapi import Path, HTTPException, APIRouter, Request, Response
 from pydantic import PositiveInt
 
 from app.models.error import HTTPError
 from app.telegram.models.body import ChannelBody
-from app.telegram.telegram import Telegram
+from app.telegram.telegram import get_telegram
+from app.utils.etag import etag_response
 
 router = APIRouter()
+telegram = get_telegram()
 
 @router.get(
     "/post/{channel}/{identifier}",
@@ -21,12 +23,13 @@ router = APIRouter()
     tags=["Channel"]
 )
 async def post(
+        request: Request,
         channel: str = Path(description="Telegram channel username."),
         identifier: PositiveInt = Path(description="Post identifier")
-) -> dict | None:
+) -> Response:
     """Request handler"""
-    result = await Telegram().post(channel, identifier)
+    result = await telegram.post(channel, identifier)
     if not result:
         raise HTTPException(status_code=404, detail="Channel or post not found")
 
-    return result
+    return etag_response(request, result)
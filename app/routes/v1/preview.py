@@ -2,13 +2,15 @@
 Route handler for /preview/{channel}
 """
 
-from fastapi import Path, HTTPException, APIRouter
+from fastapi import Path, HTTPException, APIRouter, Request, Response
 
 from app.models.error import HTTPError
 from app.telegram.models.preview import Preview
-from app.telegram.telegram import Telegram
+from app.telegram.telegram import get_telegram
+from app.utils.etag import etag_response
 
 router = APIRouter()
+telegram = get_telegram()
 
 @router.get(
     "/preview/{channel}",
@@ -20,11 +22,12 @@ router = APIRouter()
     tags=["Channel"]
 )
 async def preview(
+        request: Request,
         channel: str = Path(description="Telegram channel username.")
-) -> dict | None:
+) -> Response:
     """Request handler"""
-    result = await Telegram().preview(channel)
+    result = await telegram.preview(channel)
     if not result:
         raise HTTPException(status_code=404, detail="Channel not found")
 
-    return result
+    return etag_response(request, result)
@@ -8,13 +8,14 @@ from fastapi import HTTPException, APIRouter
 
 from app.models.error import HTTPError
 from app.telegram.models.previews import Previews
-from app.telegram.telegram import Telegram
+from app.telegram.telegram import get_telegram
 
 JSONObject = Dict[AnyStr, Any]
 JSONArray = List[Any]
 JSONStructure = Union[JSONArray, JSONObject]
 
 router = APIRouter()
+telegram = get_telegram()
 
 @router.post(
     "/previews",
@@ -44,4 +45,4 @@ async def previews(payload: JSONStructure = None) -> dict | None:
             raise HTTPException(
                 status_code=400, detail="Strings cannot be longer than 32 characters")
 
-    return {channel: await Telegram().preview(channel) for channel in payload}
+    return await telegram.previews(payload)
@@ -3,9 +3,9 @@ Model for body response container
 """
 
 from __future__ import annotations
-from typing import List, Optional
+from typing import List, Literal, Optional
 
-from pydantic import BaseModel, field_validator, HttpUrl
+from pydantic import BaseModel, HttpUrl
 
 from app.telegram.models.post import Post
 from app.telegram.models.meta import Meta
@@ -17,31 +17,9 @@ class Labels(BaseModel):
     Represents a set of labels for a Telegram channel.
 
     Attributes:
-        labels (List[str]): A list of labels assigned to the channel.
+        labels (List[Literal["verified"]]): A list of labels assigned to the channel.
     """
-    labels: List[str]
-
-    @classmethod
-    @field_validator('labels', mode='before')
-    def check_labels(cls, v: List[str]) -> List[str]:
-        """
-        Validates the labels to ensure only allowed labels are present.
-
-        Args:
-            v (List[str]): The list of labels to validate.
-
-        Returns:
-            List[str]: The validated list of labels.
-
-        Raises:
-            ValueError: If any label is not in the allowed list.
-        """
-        allowed_labels = ("verified",)
-        for label in v:
-            if label not in allowed_labels:
-                raise ValueError(
-                    f"Invalid label '{label}', only {allowed_labels} are allowed.")
-        return v
+    labels: List[Literal["verified"]]
 
 
 class Channel(BaseModel):
@@ -87,9 +65,9 @@ class Content(BaseModel):
     Represents the content associated with a Telegram channel.
 
     Attributes:
-        posts (List[Post] | Post): List of posts or selected post in the channel.
+        posts (List[Post]): List of posts, or only the selected post, in the channel.
     """
-    posts: List[Post] | Post
+    posts: List[Post]
 
 
 class ChannelBody(BaseModel):
@@ -6,10 +6,34 @@ processing HTML content in a structured and reusable way.
 """
 
 import re
+from functools import lru_cache
 from typing import Union, Optional
 
 from selectolax.lexbor import LexborNode
 
+LINE_BREAK_REGEX = re.compile(r"<br\s?/?>")
+HTML_TAG_REGEX = re.compile(r"<[^>]+>")
+BACKGROUND_IMAGE_REGEX = re.compile(
+    r"background-image:\s*?url\([',\"](.*)[',\"]\)", flags=re.I | re.M)
+
+
+@lru_cache(maxsize=32)
+def tag_content_regex(tag_name: str) -> re.Pattern[str]:
+    """
+    Builds and caches the regex matching the inner HTML of a tag.
+
+    Args:
+        tag_name (str): The name of the tag (e.g., 'div', 'span').
+
+    Returns:
+        re.Pattern[str]: The compiled pattern, capturing the tag content in group 1.
+    """
+    # Escape the tag name to avoid special regex characters
+    escaped_tag_name = re.escape(tag_name)
+    # Allow multiline and dot-all
+    return re.compile(
+        fr"<{escaped_tag_name}.*?>(.*?)</{escaped_tag_name}>", flags=re.M | re.S)
+
 
 class Utils:
     """
@@ -34,11 +58,7 @@ class Utils:
             Optional[str]: The inner HTML content of the first matching element,
                 if found; otherwise, `None`.
         """
-        # Escape the tag name to avoid special regex characters
-        escaped_tag_name = re.escape(tag_name)
-        # Construct regex to match the tag
-        pattern = fr"<{escaped_tag_name}.*?>(.*?)</{escaped_tag_name}>"
-        match = re.search(pattern, selector.html, flags=re.M | re.S)  # Allow multiline and dot-all
+        match = tag_content_regex(tag_name).search(selector.html)
         if match:
             return match.group(1)
 
@@ -55,7 +75,7 @@ class Utils:
         Returns:
             str: The text content with all HTML tags removed.
         """
-        return re.sub(r'<[^>]+>', '', html_content)
+        return HTML_TAG_REGEX.sub('', html_content)
 
     @staticmethod
     def background_extr(style: str) -> Union[str, None]:
@@ -68,7 +88,5 @@ class Utils:
         Returns:
             Union[str, None]: The background image URL, or None if not found.
         """
-        match = re.search(
-            r"background-image:\s*?url\([',\"](.*)[',\"]\)",
-            style, flags=re.I | re.M)
+        match = BACKGROUND_IMAGE_REGEX.search(style)
         return match.group(1) if match else None
@@ -1,10 +1,10 @@
 """HTML parser"""
 
-from urllib.parse import urlparse, parse_qs
+import re
 
 from selectolax.lexbor import LexborHTMLParser, LexborNode
 
-from app.telegram.parser.misc import Misc
+OFFSET_QUERY_REGEX = re.compile(r"[?&](before|after)=(\d+)")
 
 
 class Parser:
@@ -24,24 +24,6 @@ class Parser:
         """
         self.soup = LexborHTMLParser(body)
 
-    @staticmethod
-    def query(url: str) -> dict[str, int]:
-        """
-        Parses query parameters from a URL.
-
-        Args:
-            url (str): The URL to parse.
-
-        Returns:
-            Dict[str, int]: A dictionary containing parsed query parameters.
-        """
-        parsed_url = urlparse(url)
-        dictionary = parse_qs(parsed_url.query)
-        updated_dict = [{
-            v[0]: Misc.set_int(v[1][0])
-        } for v in dictionary.items()]
-        return updated_dict[0] if updated_dict else {}
-
     @staticmethod
     def get_counters(node: list[LexborNode]) -> dict[str, str]:
         """
@@ -58,22 +40,22 @@ class Parser:
             for f in node
         }
 
-    def get_meta(self, selector: str, name: str) -> str:
+    def get_meta(self, selector: str, name: str) -> str | None:
         """
         Retrieves metadata content from HTML meta tags.
 
+        The tag is matched by an attribute selector, so the filtering is done by lexbor.
+
         Args:
             selector (str): The selector attribute to match.
             name (str): The value of the selector attribute.
 
         Returns:
-            str: The content of the meta tag, or an empty string if not found.
+            str | None: The content of the first matching meta tag, or None if not found.
         """
-        return Misc.safe_index([
-            t.attributes["content"]
-            for t in self.soup.css("meta")
-            if t.attributes.get(selector) == name
-        ], 0)
+        value = name.replace("\\", "\\\\").replace('"', '\\"')
+        tag = self.soup.css_first(f'meta[{selector}="{value}"]')
+        return tag.attributes.get("content") if tag else None
 
     def get_labels(self) -> list[str]:
         """
@@ -84,9 +66,9 @@ class Parser:
             list[str]: A list of label class names present in the channel's header.
         """
         return [
-            label.attributes.get("class").split("-")[0]
+            label_class.partition("-")[0]
             for label in self.soup.css(".tgme_header_labels>i")
-            if label
+            if (label_class := label.attributes.get("class"))
         ]
 
     def get_offset(self, node: LexborNode, more: bool = False) -> dict[str, int]:
@@ -104,12 +86,12 @@ class Parser:
         keys = {}
 
         for link in links:
-            body: bool = link.attributes.get("rel") in ("prev", "next",)
-            more: bool = any(
-                key in link.attributes.keys()
-                for key in ("data-before", "data-after",))
+            # Every access to .attributes builds a new dict, so read it once per link
+            attributes = link.attributes
+            body: bool = attributes.get("rel") in ("prev", "next",)
+            more: bool = "data-before" in attributes or "data-after" in attributes
             if body or more:
-                for k, v in self.query(link.attributes.get("href")).items():
-                    keys[k] = v
+                for k, v in OFFSET_QUERY_REGEX.findall(attributes.get("href") or ""):
+                    keys[k] = int(v)
 
         return keys
@@ -5,6 +5,9 @@ import json
 
 from selectolax.lexbor import LexborHTMLParser, LexborNode
 
+DESCRIPTION_REGEX = re.compile(r"<div.*?>(.*?)</div>", flags=re.DOTALL)
+LINK_REGEX = re.compile(r"<a.*?>(.*?)</a>")
+
 
 class Channel:
     """
@@ -58,13 +61,12 @@ class Channel:
         if not description:
             return None
 
-        match_description = re.match(
-            r"<div.*?>(.*?)</div>", description.html, flags=re.DOTALL).group(1)
-        if not match_description:
+        # The node may not be a <div>, in which case there is nothing to extract
+        match_description = DESCRIPTION_REGEX.match(description.html)
+        if not match_description or not match_description.group(1):
             return None
 
-        links_sub_description = re.sub(
-            r"<a.*?>(.*?)</a>", r"\g<1>", match_description)
+        links_sub_description = LINK_REGEX.sub(r"\g<1>", match_description.group(1))
         if not links_sub_description:
             return None
 
@@ -3,7 +3,7 @@
 import re
 import json
 
-from typing import AnyStr
+from app.telegram.parser.methods.utils import LINE_BREAK_REGEX, HTML_TAG_REGEX
 
 
 class EntitiesParser:
@@ -16,6 +16,8 @@ class EntitiesParser:
     Attributes:
         patterns (tuple): A tuple of regex patterns for matching HTML entities.
         idx_map (tuple): A tuple mapping group indices in regex matches to entity types.
+        group_map (dict): A dict mapping the outer group index of a match to `idx_map`.
+        combined_pattern (re.Pattern[str]): The compiled pattern combining all `patterns`.
         html_text (str): The HTML input text with line breaks normalized.
         text_only (str): The plain text extracted from `html_text`,
             with all HTML tags removed.
@@ -24,48 +26,41 @@ class EntitiesParser:
         html_body (str): The HTML content to be parsed.
     """
 
+    patterns: tuple = (
+        r'(#\w+)',  # hashtag
+        r'<b>(.+?)<\/b>(?![^<]*<\/i>)',  # bold
+        r'<i>(.+?)<\/i>',  # italic
+        r'<u>(.+?)<\/u>',  # underline
+        r'<code>(.+?)<\/code>',  # code
+        r'<s>(.+?)<\/s>',  # strikethrough
+        r'<tg-spoiler>(.+?)<\/tg-spoiler>',  # spoiler
+
+        # emoji
+        r'<i\s+class="emoji"\s+style=".*?:url\(\'(.*?)\'\)">'
+        r'<b>(.*?)<\/b><\/i>(?![^<]*<\/tg-emoji>)',
+
+        # link in text with onclick
+        r'<a\s+(?:[^>]*?\s+)?href=\"([^\"]*)\"[^>]*\s+onclick=\"[^\"]*\"[^>]*>(.*?)<\/a>',
+        r'<a\s+(?:[^>]*?\s+)?href=\"(?!(?:.*#))(.*?)\"[^>]*>(.*?)<\/a>',  # url
+
+        # animoji
+        r'<tg-emoji.*?><i\s+class="emoji"\s+style="background-image:url\(\'(.*?)\'\)">'
+        r'<b>(.*?)</b></i></tg-emoji>'
+    )
+    idx_map: tuple = (1, 3, 5, 7, 9, 11, 13, 14, 17, 20, 23)
+    # Maps the outer group of each pattern (reported by `match.lastindex`) to its `idx_map` index
+    group_map: dict = dict(zip((1, 3, 5, 7, 9, 11, 13, 15, 18, 21, 24), idx_map))
+
+    # A single pattern combining all entity patterns, compiled once for all instances
+    combined_pattern: re.Pattern[str] = re.compile(
+        "|".join(f"({p})" for p in patterns),
+        flags=re.DOTALL | re.M
+    )
+
     def __init__(self, html_body: str) -> None:
         """Initialize the parser with HTML content."""
-        self.patterns: tuple = (
-            r'(#\w+)',  # hashtag
-            r'<b>(.+?)<\/b>(?![^<]*<\/i>)',  # bold
-            r'<i>(.+?)<\/i>',  # italic
-            r'<u>(.+?)<\/u>',  # underline
-            r'<code>(.+?)<\/code>',  # code
-            r'<s>(.+?)<\/s>',  # strikethrough
-            r'<tg-spoiler>(.+?)<\/tg-spoiler>',  # spoiler
-
-            # emoji
-            r'<i\s+class="emoji"\s+style=".*?:url\(\'(.*?)\'\)">'
-            r'<b>(.*?)<\/b><\/i>(?![^<]*<\/tg-emoji>)',
-
-            # link in text with onclick
-            r'<a\s+(?:[^>]*?\s+)?href=\"([^\"]*)\"[^>]*\s+onclick=\"[^\"]*\"[^>]*>(.*?)<\/a>',
-            r'<a\s+(?:[^>]*?\s+)?href=\"(?!(?:.*#))(.*?)\"[^>]*>(.*?)<\/a>',  # url
-
-            # animoji
-            r'<tg-emoji.*?><i\s+class="emoji"\s+style="background-image:url\(\'(.*?)\'\)">'
-            r'<b>(.*?)</b></i></tg-emoji>'
-        )
-        self.idx_map: tuple = (1, 3, 5, 7, 9, 11, 13, 14, 17, 20, 23)
-
-        self.html_text: str = re.sub(r"<br\s?/?>", "\n", html_body)
-        self.text_only: str = re.sub(r"<[^>]+>", "", self.html_text)
-
-    @property
-    def combined_pattern(self) -> re.Pattern[AnyStr]:
-        """
-        Compiles and returns a single regex pattern that combines all entity patterns.
-
-        Returns:
-            re.Pattern[AnyStr]: The compiled regex pattern for matching all entities.
-        """
-        return re.compile(
-            "|".join([
-                f"({p})" for p in self.patterns
-            ]),
-            flags=re.DOTALL | re.M
-        )
+        self.html_text: str = LINE_BREAK_REGEX.sub("\n", html_body)
+        self.text_only: str = HTML_TAG_REGEX.sub("", self.html_text)
 
     @staticmethod
     def extract_content(match: re.Match[str], depth: int = 1) -> str:
@@ -158,19 +153,18 @@ class EntitiesParser:
         entities = []
         offset = 0
 
-        matches = list(re.finditer(self.combined_pattern, self.html_text))
-        for match in matches:
+        for match in self.combined_pattern.finditer(self.html_text):
             entity_type = None
             entity_url = None
             depth = 1
 
-            for idx, group in enumerate(match.groups()):
-                if group and idx in self.idx_map:
-                    entity_type = self.message_type(idx)
-                    if entity_type in ("text_link", "emoji", "animoji",):
-                        entity_url = match.group(idx + 2)
-                        depth += {"text_link": 0, "emoji": 1, "animoji": 2}[entity_type]
-                    break
+            # Each pattern is wrapped in its own outer group, which is the last one to close
+            idx = self.group_map.get(match.lastindex)
+            if idx is not None:
+                entity_type = self.message_type(idx)
+                if entity_type in ("text_link", "emoji", "animoji",):
+                    entity_url = match.group(idx + 2)
+                    depth += {"text_link": 0, "emoji": 1, "animoji": 2}[entity_type]
 
             # Find start position in text only by finding
             # the index of the next occurrence of the match
@@ -10,7 +10,12 @@ from selectolax.lexbor import LexborHTMLParser, LexborNode
 
 from app.telegram.parser.types.entities import EntitiesParser
 from app.telegram.parser.types.media import Media
-from app.telegram.parser.methods.utils import Utils
+from app.telegram.parser.methods.utils import Utils, LINE_BREAK_REGEX
+
+MESSAGE_TEXT_REGEX = re.compile(
+    r'<div+\sclass="tgme_widget_message_text.*"+\sdir="auto">(.*?)</div>',
+    flags=re.DOTALL)
+REPLY_MESSAGE_REGEX = re.compile(r'https://t\.me/[\w-]+/(\d+)')
 
 
 class Post:
@@ -38,12 +43,12 @@ class Post:
         Converts a timestamp string to UNIX timestamp format.
 
         Args:
-            timestamp (str): The timestamp string in the format "%Y-%m-%dT%H:%M:%S%z".
+            timestamp (str): The ISO 8601 timestamp string, e.g. "2024-01-02T03:04:05+00:00".
 
         Returns:
             int: The UNIX timestamp.
         """
-        timestamp = datetime.strptime(timestamp, "%Y-%m-%dT%H:%M:%S%z")
+        timestamp = datetime.fromisoformat(timestamp)
         return int(timestamp.timestamp())
 
     def messages(self) -> list[LexborNode]:
@@ -179,12 +184,9 @@ class Post:
         delete_tags = ["a", "i", "b", "s", "u", "pre", "code", "span", "tg-emoji", "tg-spoiler"]
         selector.unwrap_tags(delete_tags)
         content_t = Utils.get_text_html(selector)
-        text = re.sub(r"<br\s?/?>", "\n", content_t)
+        text = LINE_BREAK_REGEX.sub("\n", content_t)
 
-        div = re.compile(
-            r'<div+\sclass="tgme_widget_message_text.*"+\sdir="auto">(.*?)</div>',
-            flags=re.DOTALL)
-        div_match = re.search(div, text)
+        div_match = MESSAGE_TEXT_REGEX.search(text)
         text = div_match.group(1) if div_match else text
         text = text.replace("&nbsp;", " ")
 
@@ -321,8 +323,7 @@ class Post:
                 "string": text.text(),
                 "html": Utils.get_text_html(text)
             },
-            "to_message": int(re.search(
-                r'https://t\.me/[\w-]+/(\d+)',
+            "to_message": int(REPLY_MESSAGE_REGEX.search(
                 reply.attributes.get("href")).group(1))
         }
 
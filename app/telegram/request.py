@@ -2,6 +2,8 @@
 Requests module
 """
 import re
+import asyncio
+import logging
 from typing import Literal, Union
 
 import urllib.parse
@@ -9,6 +11,13 @@ import aiohttp
 
 from app.utils.config import settings
 
+CHANNEL_REGEX = re.compile(r"^[a-zA-Z0-9_-]{3,32}$")
+MAX_POSITION = 999999
+
+# Caps simultaneous upstream requests per worker, so fan-out endpoints
+# cannot saturate t.me or the connection pool under load
+UPSTREAM_LIMIT = asyncio.Semaphore(settings.UPSTREAM_CONCURRENCY)
+
 
 class Request:
     """
@@ -16,8 +25,12 @@ class Request:
 
     Attributes:
         host (str): The base host URL for the requests.
+        session (aiohttp.ClientSession | None): Client session shared by all instances,
+            so connections are pooled and reused across requests.
     """
 
+    session: aiohttp.ClientSession | None = None
+
     def __init__(self, host: str = "t.me") -> None:
         """
         Initializes the Requests object.
@@ -27,6 +40,52 @@ class Request:
         """
         self.host = host
 
+    @classmethod
+    def get_session(cls) -> aiohttp.ClientSession:
+        """
+        Returns the shared client session, creating it on first use.
+
+        The session has to be created inside the running event loop,
+        so it is opened lazily by the first request.
+
+        Returns:
+            aiohttp.ClientSession: The shared client session.
+        """
+        if cls.session is None or cls.session.closed:
+            cls.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=settings.UPSTREAM_CONCURRENCY,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60
+                )
+            )
+
+        return cls.session
+
+    async def warmup(self) -> None:
+        """
+        Opens a keep-alive connection to the host ahead of the first request,
+        so it does not pay the TCP and TLS handshake. Failures are ignored.
+        """
+        try:
+            async with self.get_session().head(
+                    f"https://{self.host}/",
+                    allow_redirects=False,
+                    timeout=aiohttp.ClientTimeout(total=5)
+            ):
+                pass
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logging.debug(e)
+
+    @classmethod
+    async def close(cls) -> None:
+        """
+        Closes the shared client session, if it was opened.
+        """
+        if cls.session is not None:
+            await cls.session.close()
+            cls.session = None
+
     async def __request(
             self,
             path: str,
@@ -50,25 +109,24 @@ class Request:
 
         sanitized_path: str = urllib.parse.quote(path)
 
-        async with aiohttp.ClientSession() as session:
-            async with session.request(
-                    method=method,
-                    url=f"https://{self.host}/{sanitized_path}",
-                    allow_redirects=False,
-                    params=params,
-                    headers={
-                        "X-Requested-With": "XMLHttpRequest"
-                        if method == "POST" else "",
-                        "User-Agent": f"TelegramMeAPI/{settings.VERSION} (https://github.com/koval01/telegram-me; yaroslav@koval.page)"  # pylint: disable=line-too-long
-                    }
-            ) as response:
-                if response.status != 200:
-                    return None
-
-                if json:
-                    return await response.json()
-
-                return await response.text()
+        async with UPSTREAM_LIMIT, self.get_session().request(
+                method=method,
+                url=f"https://{self.host}/{sanitized_path}",
+                allow_redirects=False,
+                params=params,
+                headers={
+                    "X-Requested-With": "XMLHttpRequest"
+                    if method == "POST" else "",
+                    "User-Agent": f"TelegramMeAPI/{settings.VERSION} (https://github.com/koval01/telegram-me; yaroslav@koval.page)"  # pylint: disable=line-too-long
+                }
+        ) as response:
+            if response.status != 200:
+                return None
+
+            if json:
+                return await response.json()
+
+            return await response.text()
 
     @staticmethod
     def valid_channel(channel: str) -> bool:
@@ -81,7 +139,10 @@ class Request:
         Returns:
         - bool: True if the channel name is valid, False otherwise.
         """
-        return bool(re.match(r"^[a-zA-Z0-9_-]{3,32}$", channel))
+        if not 3 <= len(channel) <= 32:
+            return False
+
+        return CHANNEL_REGEX.match(channel) is not None
 
     @staticmethod
     def valid_position(position: int) -> bool:
@@ -94,11 +155,7 @@ class Request:
         Returns:
         - bool: True if the position is valid, False otherwise.
         """
-        pattern = re.compile(r'^[0-9]{1,6}$')
-        if re.match(pattern, str(position)) and 0 <= position <= 1000000:
-            return True
-
-        return False
+        return 0 <= position <= MAX_POSITION
 
     async def body(self, channel: str, position: int = 0) -> Union[str, None]:
         """
@@ -2,14 +2,21 @@
 Telegram main module
 """
 
-from typing import Literal
+import asyncio
+import logging
+from functools import lru_cache
+from typing import Any, Literal
 
+from app.telegram.parser.parser import Parser
 from app.telegram.parser.methods.body import Body
 from app.telegram.parser.methods.more import More
 from app.telegram.parser.methods.preview import Preview
 
 from app.telegram.request import Request
 
+from app.utils.cache import cached
+from app.utils.config import settings
+
 
 class Telegram:
     """
@@ -25,6 +32,39 @@ class Telegram:
         ...
 
     @staticmethod
+    async def warmup() -> None:
+        """
+        Pre-establishes the upstream connection.
+        Should be called once on application startup.
+        """
+        await Request().warmup()
+
+    @staticmethod
+    async def close() -> None:
+        """
+        Releases the upstream HTTP connection pool.
+        Should be called once on application shutdown.
+        """
+        await Request.close()
+
+    @staticmethod
+    async def __parse(parser: type[Parser], body: str, *args: Any) -> Any:
+        """
+        Parses an upstream response in a worker thread,
+        so CPU-bound HTML processing does not block the event loop.
+
+        Args:
+            parser (type[Parser]): The parser class to use.
+            body (str): The response content to parse.
+            *args (Any): Arguments passed to the parser's get method.
+
+        Returns:
+            Any: The result of the parser's get method.
+        """
+        return await asyncio.to_thread(lambda: parser(body).get(*args))
+
+    @staticmethod
+    @cached(ttl=settings.CACHE_TTL, maxsize=settings.CACHE_MAXSIZE)
     async def body(channel: str, position: int = 0) -> dict:
         """
         Retrieve the body of a message from a Telegram channel.
@@ -41,9 +81,10 @@ class Telegram:
         if not response:
             return {}
 
-        return Body(response).get()
+        return await Telegram.__parse(Body, response)
 
     @staticmethod
+    @cached(ttl=settings.CACHE_TTL, maxsize=settings.CACHE_MAXSIZE)
     async def more(channel: str, position: int, direction: Literal["after", "before"]) -> dict:
         """
         Retrieve additional messages from a Telegram channel.
@@ -63,11 +104,12 @@ class Telegram:
             return {}
 
         # additional validation response
-        response = More(response).get()
+        response = await Telegram.__parse(More, response)
         response["posts"] = list(filter(lambda post: post["id"] != position, response["posts"]))
         return response
 
     @staticmethod
+    @cached(ttl=settings.CACHE_TTL, maxsize=settings.CACHE_MAXSIZE)
     async def post(channel: str, position: int) -> dict:
         """
         Retrieve a specific post from a Telegram channel.
@@ -84,13 +126,14 @@ class Telegram:
         if not response:
             return {}
 
-        response = Body(response).get(position)
+        response = await Telegram.__parse(Body, response, position)
         if not response["content"]["posts"]:
             return {}
 
         return response
 
     @staticmethod
+    @cached(ttl=settings.CACHE_TTL, maxsize=settings.CACHE_MAXSIZE)
     async def preview(channel: str) -> dict:
         """
         Retrieve preview information of channel.
@@ -105,4 +148,41 @@ class Telegram:
         if not response:
             return {}
 
-        return Preview(response).get()
+        return await Telegram.__parse(Preview, response)
+
+    @staticmethod
+    async def previews(channels: list[str]) -> dict[str, dict | None]:
+        """
+        Retrieve preview information of several channels concurrently.
+
+        Args:
+            channels (list[str]): The channel names or IDs.
+
+        Returns:
+            dict[str, dict | None]: Preview information keyed by channel,
+            None for channels which could not be fetched.
+        """
+        # Duplicated channels are fetched only once
+        unique = list(dict.fromkeys(channels))
+        results = await asyncio.gather(
+            *(Telegram.preview(channel) for channel in unique), return_exceptions=True)
+
+        previews = {}
+        for channel, result in zip(unique, results):
+            if isinstance(result, Exception):
+                logging.warning("Failed to fetch preview of %s", channel, exc_info=result)
+                result = None
+            previews[channel] = result
+
+        return previews
+
+
+@lru_cache(maxsize=1)
+def get_telegram() -> Telegram:
+    """
+    Returns the process-wide Telegram instance.
+
+    Returns:
+        Telegram: The shared Telegram instance.
+    """
+    return Telegram()
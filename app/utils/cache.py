@@ -0,0 +1,128 @@
+"""
+In-memory caching and request coalescing for coroutine results
+"""
+
+import asyncio
+import time
+from functools import partial, wraps
+from typing import Any, Awaitable, Callable, Hashable
+
+
+def _make_key(args: tuple, kwargs: dict) -> Hashable:
+    """
+    Builds a hashable cache key from call arguments.
+
+    Args:
+        args (tuple): Positional arguments of the call.
+        kwargs (dict): Keyword arguments of the call.
+
+    Returns:
+        Hashable: The cache key.
+    """
+    return args, tuple(sorted(kwargs.items()))
+
+
+def _release(inflight: dict[Hashable, asyncio.Task], key: Hashable, task: asyncio.Task) -> None:
+    """
+    Drops a finished task from the in-flight registry.
+
+    The exception is retrieved here as well, so a failure nobody awaited
+    any more (all callers were cancelled) is not reported as never retrieved.
+
+    Args:
+        inflight (dict[Hashable, asyncio.Task]): The in-flight registry.
+        key (Hashable): The key the task is registered under.
+        task (asyncio.Task): The finished task.
+    """
+    inflight.pop(key, None)
+    if not task.cancelled():
+        task.exception()
+
+
+def coalesce(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """
+    Decorator merging concurrent calls of a coroutine function with the same arguments.
+
+    While a call is in flight, further calls with the same arguments attach
+    to it instead of starting another execution, so a burst of identical
+    requests results in a single upstream fetch.
+
+    Args:
+        func (Callable[..., Awaitable[Any]]): The coroutine function to wrap.
+
+    Returns:
+        Callable[..., Awaitable[Any]]: The wrapped coroutine function.
+    """
+    inflight: dict[Hashable, asyncio.Task] = {}
+
+    @wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        key = _make_key(args, kwargs)
+
+        task = inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func(*args, **kwargs))
+            inflight[key] = task
+            task.add_done_callback(partial(_release, inflight, key))
+
+        # Shield the shared task so one cancelled caller does not cancel the others
+        return await asyncio.shield(task)
+
+    return wrapper
+
+
+def cached(ttl: int, maxsize: int = 1024) -> Callable:
+    """
+    Decorator caching the results of a coroutine function in process memory.
+
+    Results are kept for `ttl` seconds and keyed by the call arguments.
+    Concurrent misses are coalesced into a single execution.
+    Empty results are not cached.
+    Expired results are dropped on every call, so they do not outlive a burst of traffic.
+    A `ttl` or `maxsize` of 0 disables caching; calls are still coalesced.
+
+    Args:
+        ttl (int): Time in seconds for which a result is kept.
+        maxsize (int): Maximum number of cached results.
+
+    Returns:
+        Callable: The decorator.
+    """
+
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        store: dict[Hashable, tuple[float, Any]] = {}
+        shared = coalesce(func)
+
+        def purge(now: float) -> None:
+            # Entries share one ttl and are re-inserted on refresh,
+            # so insertion order is also expiry order
+            while store:
+                key = next(iter(store))
+                if store[key][0] > now:
+                    break
+                del store[key]
+
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = _make_key(args, kwargs)
+
+            purge(time.monotonic())
+            entry = store.get(key)
+            if entry:
+                return entry[1]
+
+            result = await shared(*args, **kwargs)
+            if result and ttl > 0 and maxsize > 0:
+                now = time.monotonic()
+                purge(now)
+                store.pop(key, None)
+                while store and len(store) >= maxsize:
+                    # The first key is the entry closest to expiry
+                    del store[next(iter(store))]
+                store[key] = (now + ttl, result)
+
+            return result
+
+        return wrapper
+
+    return decorator
@@ -2,6 +2,7 @@
 .env variables loader
 """
 
+from pydantic import NonNegativeInt, PositiveInt
 from pydantic_settings import BaseSettings
 
 
@@ -13,6 +14,9 @@ class Settings(BaseSettings):  # pylint: disable=R0903
 
     DISABLE_DOCS: int = 0
     VERSION: str = "1.3"
+    CACHE_TTL: NonNegativeInt = 10
+    CACHE_MAXSIZE: NonNegativeInt = 32
+    UPSTREAM_CONCURRENCY: PositiveInt = 64
 
     class Config:  # pylint: disable=R0903
         """
@@ -0,0 +1,37 @@
+"""
+Conditional JSON responses with ETag validation
+"""
+
+import hashlib
+from typing import Any
+
+import orjson
+from fastapi import Request, Response
+
+
+def etag_response(request: Request, content: Any) -> Response:
+    """
+    Builds a JSON response carrying an ETag derived from its body.
+
+    If the client already holds the same representation (If-None-Match),
+    an empty 304 Not Modified response is returned instead.
+
+    Args:
+        request (Request): The incoming request object.
+        content (Any): The content to serialize.
+
+    Returns:
+        Response: A 200 response with the JSON body, or an empty 304 response.
+    """
+    body = orjson.dumps(content)  # pylint: disable=E1101
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    headers = {"ETag": etag}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        # Weak comparison, as required for If-None-Match (RFC 9110, 13.1.2)
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag in candidates or "*" in candidates:
+            return Response(status_code=304, headers=headers)
+
+    return Response(body, media_type="application/json", headers=headers)